@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from typing import Dict, List, Tuple, Type, TypeVar, Union
+from typing import Dict, Iterable, List, Tuple, Type, TypeVar, Union
 
 import numpy as np
 from gensim.models.keyedvectors import KeyedVectors
@@ -117,6 +117,22 @@ class Embedding(KeyedVectors):
 
         return self.frequencies[key]
 
+    def get_frequencies(self, keys: Iterable[Union[str, int]]) -> np.ndarray:
+        """Return frequencies of several elements at once
+
+        Args:
+            keys (Iterable[Union[str, int]]): keys or indices of elements.
+
+        Returns:
+            np.ndarray: frequencies in the same order than keys
+        """
+        indices = np.fromiter(
+            (self.key_to_index[k] if isinstance(k, str) else k for k in keys),
+            dtype=np.intp,
+        )
+
+        return self.frequencies[indices]
+
     def set_frequencies(self, frequencies: Union[list, np.ndarray, dict]):
         """Set frequencies from a dict or a array-like
 
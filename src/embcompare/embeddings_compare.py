@@ -1,7 +1,8 @@
 import collections
+import random
 from functools import cached_property
 from itertools import islice
-from random import sample, shuffle
+from random import Random, shuffle
 from typing import Any, Dict, Hashable, Tuple, TypeVar, Union
 
 import numpy as np
@@ -123,24 +124,28 @@ class EmbeddingComparison:
         Returns:
             list: A list of common elements between the two compared embeddings
         """
-        common_keys = {}
-
         first_emb, second_emb = self.embeddings
-        frequencies_are_set = self.is_frequencies_set()
-
-        for key in first_emb.key_to_index:
-            if key in second_emb.key_to_index:
 
-                if frequencies_are_set:
-                    f1 = first_emb.get_frequency(key)
-                    f2 = second_emb.get_frequency(key)
-                else:
-                    f1 = first_emb.key_to_index[key] / len(first_emb.key_to_index)
-                    f2 = second_emb.key_to_index[key] / len(first_emb.key_to_index)
+        common_keys = [
+            key for key in first_emb.key_to_index if key in second_emb.key_to_index
+        ]
 
-                common_keys[key] = f1 + f2
+        if self.is_frequencies_set():
+            # Most frequent elements come first
+            scores = -(
+                first_emb.get_frequencies(common_keys)
+                + second_emb.get_frequencies(common_keys)
+            )
+        else:
+            # Elements with the lowest relative positions come first
+            scores = sum(
+                np.fromiter((emb.key_to_index[k] for k in common_keys), dtype=np.intp)
+                / len(first_emb.key_to_index)
+                for emb in (first_emb, second_emb)
+            )
 
-        return sorted(common_keys, key=common_keys.get, reverse=frequencies_are_set)
+        # A stable sort keeps the first embedding order between equal scores
+        return [common_keys[i] for i in np.argsort(scores, kind="stable")]
 
     @cached_property
     def neighborhoods(self) -> Tuple[dict, dict]:
@@ -330,6 +335,7 @@ class EmbeddingComparison:
         n_samples: int = 10000,
         strategy: str = "first",
         keep_common_only: bool = True,
+        random_state: int = None,
     ) -> TEmbeddingComparison:
         """Sample both embeddings to reduce their size and return a comparison between
         the sampled embeddings
@@ -338,6 +344,9 @@ class EmbeddingComparison:
             n_samples (int, optional): number of sample. Defaults to 10000.
             strategy (str, optional): sample strategy. Defaults to first (which are most
                 frequent terms in fasttext).
+            random_state (int, optional): seed used by the "random" strategy so the
+                sampling is reproducible. When None, the global random module state
+                is used. Defaults to None.
 
         Returns:
             TEmbeddingComparison: A EmbeddingComparison object based on sampled embeddings
@@ -354,7 +363,8 @@ class EmbeddingComparison:
         if strategy == "first":
             selected_keys = self.common_keys[:n_samples]
         elif strategy == "random":
-            selected_keys = sample(self.common_keys, n_samples)
+            rng = random if random_state is None else Random(random_state)
+            selected_keys = rng.sample(self.common_keys, n_samples)
         else:
             raise ValueError(
                 f"strategy shloud be 'first' or 'random'. Received : {strategy}"
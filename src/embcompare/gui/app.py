@@ -15,13 +15,16 @@ from embcompare.gui.features import (
 )
 from embcompare.gui.helpers import create_comparison, stop_if_any_embedding_unset
 from loguru import logger
+from omegaconf import OmegaConf
 
 logger.remove()
 logger.add(sys.stderr, level=st.get_option("logger.level").upper())
 
 st.set_page_config(page_title="Embedding comparison", page_icon="📊")
 
-config = load_configs(*sys.argv[1:])
+# The configuration is converted once into plain python dicts so that accesses
+# in the app do not go through OmegaConf nodes resolution
+config = OmegaConf.to_container(load_configs(*sys.argv[1:]), resolve=True)
 
 
 def main():
@@ -11,7 +11,11 @@ def display_embeddings_config(config_embeddings: dict, emb1_id: str, emb2_id: st
         emb2_id (str): second embedding id
     """
     st.header("Embeddings configurations")
-    for emb_id, col in zip((emb1_id, emb2_id), st.columns(2)):
+
+    # When the same embedding is selected twice, its configuration is displayed once
+    emb_ids = (emb1_id,) if emb1_id == emb2_id else (emb1_id, emb2_id)
+
+    for emb_id, col in zip(emb_ids, st.columns(len(emb_ids))):
         if emb_id in config_embeddings:
             emb_infos = config_embeddings[emb_id]
             with col:
@@ -43,8 +43,8 @@ def display_frequencies_comparison(comparison: EmbeddingComparison):
     # Compute ratio difference bewteen common elements of both embeddings
     # the ratio is smoothed by addind minimum frequency to numerator and
     # denominator
-    emb1_freqs = np.array([emb1.get_frequency(k) for k in comparison.common_keys])
-    emb2_freqs = np.array([emb2.get_frequency(k) for k in comparison.common_keys])
+    emb1_freqs = emb1.get_frequencies(comparison.common_keys)
+    emb2_freqs = emb2.get_frequencies(comparison.common_keys)
 
     diff = np.abs(np.log2((emb1_freqs + min_freq) / (emb2_freqs + min_freq)))
 
@@ -1,11 +1,28 @@
 from typing import List, Tuple
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 from embcompare import EmbeddingComparison
 from loguru import logger
 
 
+def neighbors_arrays(
+    neighbors: List[Tuple[str, float]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Split a list of (neighbor, similarity) tuples into two arrays
+
+    Args:
+        neighbors (List[Tuple[str, float]]): list of (neighbor, similarity) tuples
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: neighbors keys and their similarities
+    """
+    keys, similarities = zip(*neighbors)
+
+    return np.array(keys, dtype=object), np.array(similarities, dtype=np.float32)
+
+
 def display_neighborhoods_comparisons(
     comparison: EmbeddingComparison, elements: List[Tuple[str, float]]
 ):
@@ -22,6 +39,8 @@ def display_neighborhoods_comparisons(
     else:
         emb1_labels, emb2_labels = ({}, {})
 
+    labels1_get, labels2_get = emb1_labels.get, emb2_labels.get
+
     least_similar_keys, least_similar_sim = list(zip(*elements))
 
     logger.info("Get first embedding neighbors...")
@@ -37,7 +56,7 @@ def display_neighborhoods_comparisons(
     logger.info("Display neighbors comparisons...")
     for key, similarity in zip(least_similar_keys, least_similar_sim):
 
-        label = emb1_labels.get(key, key)
+        label = labels1_get(key, key)
 
         with st.expander(f"{label} (similarity {similarity:.0%})"):
             # Display frequencies
@@ -49,45 +68,48 @@ def display_neighborhoods_comparisons(
 
                         st.write(f"term frequency : {freq_str}")
 
-            neighbors1 = {k: s for k, s in neighborhoods_1[key]}
-            neighbors2 = {k: s for k, s in neighborhoods_2[key]}
+            keys1, sims1 = neighbors_arrays(neighborhoods_1[key])
+            keys2, sims2 = neighbors_arrays(neighborhoods_2[key])
 
-            # Display common neighbors
-            common_neighbors = {
-                k: i for i, k in enumerate(neighbors1) if k in neighbors2
-            }
+            # Partition neighbors in common and distinct neighbors while
+            # preserving neighbors order
+            common_mask1 = np.isin(keys1, keys2)
+            common_mask2 = np.isin(keys2, keys1)
 
-            if common_neighbors:
+            # Similarities in the second embedding of the common neighbors
+            sims2_by_key = dict(neighborhoods_2[key])
+
+            # Display common neighbors
+            if common_mask1.any():
                 st.subheader("common neighbors")
                 st.table(
                     pd.DataFrame(
                         {
                             "neighbor": [
-                                emb1_labels.get(k, k) for k in common_neighbors
+                                labels1_get(k, k) for k in keys1[common_mask1]
+                            ],
+                            "sim1": [f"{s:.1%}" for s in sims1[common_mask1]],
+                            "sim2": [
+                                f"{sims2_by_key[k]:.1%}" for k in keys1[common_mask1]
                             ],
-                            "sim1": [f"{neighbors1[k]:.1%}" for k in common_neighbors],
-                            "sim2": [f"{neighbors2[k]:.1%}" for k in common_neighbors],
                         }
                     )
                 )
 
             # Display other neighbors
-            only1 = {
-                k: i for i, k in enumerate(neighbors1) if k not in common_neighbors
-            }
-            only2 = {
-                k: i for i, k in enumerate(neighbors2) if k not in common_neighbors
-            }
-
-            if only1:
+            if not common_mask1.all():
                 st.subheader("distinct neighbors")
                 st.table(
                     pd.DataFrame(
                         {
-                            "neighbor1": [emb1_labels.get(k, k) for k in only1],
-                            "sim1": [f"{neighbors1[k]:.1%}" for k in only1],
-                            "sim2": [f"{neighbors2[k]:.1%}" for k in only2],
-                            "neighbor2": [emb2_labels.get(k, k) for k in only2],
+                            "neighbor1": [
+                                labels1_get(k, k) for k in keys1[~common_mask1]
+                            ],
+                            "sim1": [f"{s:.1%}" for s in sims1[~common_mask1]],
+                            "sim2": [f"{s:.1%}" for s in sims2[~common_mask2]],
+                            "neighbor2": [
+                                labels2_get(k, k) for k in keys2[~common_mask2]
+                            ],
                         }
                     )
                 )
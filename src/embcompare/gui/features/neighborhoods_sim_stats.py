@@ -20,8 +20,8 @@ def weighted_median(values: np.ndarray, weights: np.ndarray) -> float:
         float: median value
     """
     i = np.argsort(values)
-    c = np.cumsum(weights[i])
-    return values[i[np.searchsorted(c, c[-1] / 2)]]
+    c = np.cumsum(weights[i], dtype=np.float64)
+    return values[i[np.searchsorted(c, c[-1] * 0.5)]]
 
 
 def compute_weighted_median_similarity(comparison: EmbeddingComparison) -> float:
@@ -35,12 +35,8 @@ def compute_weighted_median_similarity(comparison: EmbeddingComparison) -> float
     """
     emb1, emb2 = comparison.embeddings
 
-    freqs_1 = np.array(
-        [emb1.get_frequency(k) for k in comparison.neighborhoods_similarities]
-    )
-    freqs_2 = np.array(
-        [emb2.get_frequency(k) for k in comparison.neighborhoods_similarities]
-    )
+    freqs_1 = emb1.get_frequencies(comparison.neighborhoods_similarities)
+    freqs_2 = emb2.get_frequencies(comparison.neighborhoods_similarities)
     freqs_mean = (freqs_1 + freqs_2) / 2
 
     return weighted_median(comparison.neighborhoods_similarities_values, freqs_mean)
@@ -59,12 +55,8 @@ def compute_weighted_median_ordered_similarity(
     """
     emb1, emb2 = comparison.embeddings
 
-    freqs_1 = np.array(
-        [emb1.get_frequency(k) for k in comparison.neighborhoods_ordered_similarities]
-    )
-    freqs_2 = np.array(
-        [emb2.get_frequency(k) for k in comparison.neighborhoods_ordered_similarities]
-    )
+    freqs_1 = emb1.get_frequencies(comparison.neighborhoods_ordered_similarities)
+    freqs_2 = emb2.get_frequencies(comparison.neighborhoods_ordered_similarities)
     freqs_mean = (freqs_1 + freqs_2) / 2
 
     return weighted_median(
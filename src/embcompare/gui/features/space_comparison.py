@@ -4,7 +4,6 @@ import pandas as pd
 import streamlit as st
 from embcompare import EmbeddingComparison
 from loguru import logger
-from sklearn.decomposition import PCA
 
 
 def display_spaces_comparison(comparison: EmbeddingComparison):
@@ -13,6 +12,9 @@ def display_spaces_comparison(comparison: EmbeddingComparison):
     Args:
         comparison (EmbeddingComparison): A EmbeddingComparison object
     """
+    # PCA is imported here since sklearn.decomposition is only needed once
+    # embeddings are selected
+    from sklearn.decomposition import PCA
 
     logger.info(f"Computing neighborhoods_similarities_values...")
     neighborhood_sim_values = comparison.neighborhoods_similarities_values
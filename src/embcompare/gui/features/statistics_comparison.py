@@ -1,3 +1,5 @@
+from typing import Tuple
+
 import altair as alt
 import numpy as np
 import pandas as pd
@@ -5,36 +7,94 @@ import streamlit as st
 from embcompare import EmbeddingComparison
 from loguru import logger
 
-from ..helpers import round_sig
+from ..helpers import build_reports, round_sig
 
 # theme from color.adobe.com : #253659 #03A696 #04BF9D #F27457 #BF665E
 EMB_COLORS = ("#04BF9D", "#F27457")
 
 
-def display_statistics_comparison(comparison: EmbeddingComparison):
-    """Display a comparison betwenn distance statistics in embedding neihborhoods
+def compute_histogram(
+    values: np.ndarray, extent: Tuple[float, float], maxbins: int = 20
+) -> pd.DataFrame:
+    """Bin values into an histogram
 
     Args:
-        comparison (EmbeddingComparison): A EmbeddingComparison object
+        values (np.ndarray): values to bin
+        extent (Tuple[float, float]): lower and upper bounds of the bins
+        maxbins (int, optional): number of bins. Defaults to 20.
+
+    Returns:
+        pd.DataFrame: a DataFrame containing bins bounds (x0 and x1) and counts
     """
-    emb1, emb2 = comparison.embeddings
+    counts, edges = np.histogram(values, bins=maxbins, range=extent)
 
-    logger.info(f"Computing first embedding neighborhoods...")
-    emb1_dist, _ = emb1.compute_neighborhoods(n_neighbors=comparison.n_neighbors)
+    return pd.DataFrame({"x0": edges[:-1], "x1": edges[1:], "count": counts})
 
-    logger.info(f"Computing second embedding neighborhoods...")
-    emb2_dist, _ = emb2.compute_neighborhoods(n_neighbors=comparison.n_neighbors)
 
-    emb1_df = pd.DataFrame(
-        {"mean_dist": np.mean(emb1_dist, axis=1), "mean_first_dist": emb1_dist[:, 0]}
-    )
-    emb2_df = pd.DataFrame(
-        {
-            "mean_dist": np.mean(emb2_dist, axis=1),
-            "mean_first_dist": emb2_dist[:, 0],
-        }
+def values_extent(*values: pd.Series) -> Tuple[float, float]:
+    """Compute the common extent of several series of values
+
+    Args:
+        *values (pd.Series): series of values
+
+    Returns:
+        Tuple[float, float]: minimum and maximum of all values
+    """
+    arrays = [v.to_numpy() for v in values]
+
+    return min(a.min() for a in arrays), max(a.max() for a in arrays)
+
+
+def altair_histogram(
+    df: pd.DataFrame,
+    col: str,
+    extent: Tuple[float, float],
+    color: str,
+    maxbins: int = 20,
+) -> alt.Chart:
+    """Create an histogram of a DataFrame column
+
+    Values are binned with numpy so only bins counts are sent to the browser
+
+    Args:
+        df (pd.DataFrame): DataFrame containing the values
+        col (str): column of the values
+        extent (Tuple[float, float]): lower and upper bounds of the bins
+        color (str): bars color
+        maxbins (int, optional): number of bins. Defaults to 20.
+
+    Returns:
+        alt.Chart: an altair bar chart
+    """
+    df_hist = compute_histogram(df[col].to_numpy(), extent, maxbins)
+
+    return (
+        alt.Chart(df_hist)
+        .mark_bar()
+        .encode(
+            x=alt.X("x0:Q", title=None),
+            x2="x1:Q",
+            y=alt.Y("count:Q", axis=None),
+            color=alt.value(color),
+        )
     )
 
+
+def display_statistics_comparison(comparison: EmbeddingComparison):
+    """Display a comparison betwenn distance statistics in embedding neihborhoods
+
+    Args:
+        comparison (EmbeddingComparison): A EmbeddingComparison object
+    """
+    emb1_df, emb2_df = build_reports(comparison)
+
+    # When both embeddings are identical, their statistics are displayed once
+    if emb1_df is emb2_df:
+        st.info("Both embeddings are identical")
+        emb_dfs = (emb1_df,)
+    else:
+        emb_dfs = (emb1_df, emb2_df)
+
     # Distances to neighbors
     st.subheader("Distances to neighbors")
     with st.expander("📘 Explanation of the calculation"):
@@ -50,23 +110,12 @@ The median of the mean distances tells about how well the elements are grouped t
         )
     logger.info(f"Displaying distances to neighbors...")
 
-    min_mean_dist = min(emb1_df["mean_dist"].min(), emb2_df["mean_dist"].min())
-    max_mean_dist = max(emb2_df["mean_dist"].max(), emb2_df["mean_dist"].max())
+    extent = values_extent(*(emb_df["mean_dist"] for emb_df in emb_dfs))
 
-    for emb_df, col, color in zip((emb1_df, emb2_df), st.columns(2), EMB_COLORS):
+    for emb_df, col, color in zip(emb_dfs, st.columns(len(emb_dfs)), EMB_COLORS):
         with col:
             st.altair_chart(
-                alt.Chart(emb_df)
-                .mark_bar()
-                .encode(
-                    x=alt.X(
-                        "mean_dist",
-                        bin=alt.Bin(extent=[min_mean_dist, max_mean_dist], maxbins=20),
-                        title=None,
-                    ),
-                    y=alt.Y("count()", axis=None),
-                    color=alt.value(color),
-                ),
+                altair_histogram(emb_df, "mean_dist", extent=extent, color=color),
                 use_container_width=True,
             )
             median = round_sig(emb_df["mean_dist"].median(), n_digits=2)
@@ -83,27 +132,12 @@ The median of the distances tells about how sparse are the embeddings
         )
     logger.info(f"Displaying mean distances to nearest neighbor...")
 
-    min_mean_dist = min(
-        emb1_df["mean_first_dist"].min(), emb2_df["mean_first_dist"].min()
-    )
-    max_mean_dist = max(
-        emb2_df["mean_first_dist"].max(), emb2_df["mean_first_dist"].max()
-    )
+    extent = values_extent(*(emb_df["mean_first_dist"] for emb_df in emb_dfs))
 
-    for emb_df, col, color in zip((emb1_df, emb2_df), st.columns(2), EMB_COLORS):
+    for emb_df, col, color in zip(emb_dfs, st.columns(len(emb_dfs)), EMB_COLORS):
         with col:
             st.altair_chart(
-                alt.Chart(emb_df)
-                .mark_bar()
-                .encode(
-                    x=alt.X(
-                        "mean_first_dist",
-                        bin=alt.Bin(extent=[min_mean_dist, max_mean_dist], maxbins=20),
-                        title=None,
-                    ),
-                    y=alt.Y("count()", axis=None),
-                    color=alt.value(color),
-                ),
+                altair_histogram(emb_df, "mean_first_dist", extent=extent, color=color),
                 use_container_width=True,
             )
             median = round_sig(emb_df["mean_first_dist"].median(), n_digits=2)
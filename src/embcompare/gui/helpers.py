@@ -1,12 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Tuple
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 from loguru import logger
 
 from ..embedding import Embedding
 from ..embeddings_compare import EmbeddingComparison
 from ..load_utils import EMBEDDING_FORMATS, load_embedding, load_frequencies
+from ..reports import EmbeddingReport
 
 
 def round_sig(value: float, n_digits: int = 2) -> float:
@@ -51,7 +55,7 @@ def stop_if_any_embedding_unset(config_embeddings: dict, emb1_id: str, emb2_id:
     st.stop()
 
 
-@st.cache(suppress_st_warning=True, allow_output_mutation=True, max_entries=3)
+@st.cache_resource(max_entries=3, show_spinner="Loading embedding…")
 def load_and_cache_embedding(
     embedding_path: str,
     embedding_format: str,
@@ -60,6 +64,9 @@ def load_and_cache_embedding(
 ) -> Embedding:
     """Load and cache an embedding
 
+    The loaded embedding is shared between all sessions and reruns so it must
+    not be mutated after loading.
+
     Args:
         embedding_path (str): embedding path
         embedding_format (str): embeddding format
@@ -84,7 +91,6 @@ def load_and_cache_embedding(
         )
 
 
-@st.cache(allow_output_mutation=True, suppress_st_warning=True, max_entries=1)
 def create_comparison(
     config_embeddings: dict,
     emb1_id: str,
@@ -95,6 +101,9 @@ def create_comparison(
 ) -> EmbeddingComparison:
     """Load and cache two embeddings and return them in an EmbeddingComparison object
 
+    Comparisons are cached according to the configuration of both embeddings and
+    the comparison parameters (see load_and_cache_comparison).
+
     Args:
         config_embeddings (dict): embeddings configuration dict
         emb1_id (str): first embedding id
@@ -108,6 +117,48 @@ def create_comparison(
         EmbeddingComparison: an EmbeddingComparison object based on the two loaded
             embeddings
     """
+    return load_and_cache_comparison(
+        config_embeddings[emb1_id],
+        config_embeddings[emb2_id],
+        emb1_id=emb1_id,
+        emb2_id=emb2_id,
+        n_neighbors=n_neighbors,
+        max_emb_size=max_emb_size,
+        min_frequency=min_frequency,
+    )
+
+
+@st.cache_resource(max_entries=4)
+def load_and_cache_comparison(
+    emb1_infos: dict,
+    emb2_infos: dict,
+    emb1_id: str,
+    emb2_id: str,
+    n_neighbors: int,
+    max_emb_size: int,
+    min_frequency: float = None,
+) -> EmbeddingComparison:
+    """Load and cache two embeddings and return them in an EmbeddingComparison object
+
+    Only the configuration entries of the compared embeddings are part of the
+    cache key, so changing an embedding configuration invalidates its comparisons
+    while adding or editing other embeddings does not.
+
+    Args:
+        emb1_infos (dict): first embedding configuration
+        emb2_infos (dict): second embedding configuration
+        emb1_id (str): first embedding id
+        emb2_id (str): second embedding id
+        n_neighbors (int): number of neighbors for comparison
+        max_emb_size (int): maximum size of the embeddings
+        min_frequency (float, optional): minimal frequency for an element to be taken
+            into account. Defaults to None.
+
+    Returns:
+        EmbeddingComparison: an EmbeddingComparison object based on the two loaded
+            embeddings
+    """
+    config_embeddings = {emb1_id: emb1_infos, emb2_id: emb2_infos}
     embeddings = {}
 
     for emb_id, col in zip((emb1_id, emb2_id), st.columns(2)):
@@ -138,8 +189,9 @@ def create_comparison(
 
     comparison = EmbeddingComparison(embeddings, n_neighbors=n_neighbors)
 
-    # Sample comparison to reduce memory consuption
-    comparison = comparison.sampled_comparison(n_samples=max_emb_size)
+    # Sample comparison to reduce memory consuption. Most frequent elements are
+    # selected so the sampling is deterministic and stable across reruns
+    comparison = comparison.sampled_comparison(n_samples=max_emb_size, strategy="first")
 
     # Load embeddings labels if provided and add them to comparison
     comparison.labels = load_and_cache_embeddings_labels(
@@ -149,10 +201,110 @@ def create_comparison(
     return comparison
 
 
+def summarize_distances(nn_dist: np.ndarray) -> np.ndarray:
+    """Summarize a nearest neighbors distance matrix
+
+    Both statistics are written in a single preallocated block of the same
+    dtype than nn_dist so the DataFrame built from it does not need any copy
+    or dtype inference.
+
+    Args:
+        nn_dist (np.ndarray): nearest neighbors distance matrix
+
+    Returns:
+        np.ndarray: a (n_elements, 2) array containing for each element the mean
+            distance to its neighbors and the distance to its nearest neighbor
+    """
+    summary = np.empty((nn_dist.shape[0], 2), dtype=nn_dist.dtype)
+
+    nn_dist.mean(axis=1, out=summary[:, 0])
+    summary[:, 1] = nn_dist[:, 0]
+
+    return summary
+
+
+def build_report(emb: Embedding, n_neighbors: int) -> pd.DataFrame:
+    """Compute neighbors distances statistics of an embedding
+
+    Args:
+        emb (Embedding): an Embedding object
+        n_neighbors (int): number of neighbors
+
+    Returns:
+        pd.DataFrame: a DataFrame containing the mean distance of elements to
+            their neighbors (mean_dist) and the distance to their nearest
+            neighbor (mean_first_dist)
+    """
+    report = EmbeddingReport(emb, n_neighbors=n_neighbors)
+
+    # float32 precision is enough for display and halves memory traffic
+    nn_dist = report.nearest_neighbors_distances.astype(np.float32, copy=False)
+
+    return pd.DataFrame(
+        summarize_distances(nn_dist), columns=["mean_dist", "mean_first_dist"]
+    )
+
+
+def build_reports(comparison: EmbeddingComparison) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Compute neighbors distances statistics of both embeddings of a comparison
+
+    Neighborhoods are stored in the embeddings of the comparison once computed,
+    so the nearest neighbors search is not repeated when the comparison is
+    cached (see create_comparison).
+
+    Args:
+        comparison (EmbeddingComparison): an EmbeddingComparison object
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: a DataFrame for each embedding containing
+            the mean distance of elements to their neighbors (mean_dist) and the
+            distance to their nearest neighbor (mean_first_dist). When both
+            embeddings are identical, the same DataFrame is returned twice.
+    """
+    emb1, emb2 = comparison.embeddings
+    emb1_id, emb2_id = comparison.embeddings_ids
+
+    # Identical embeddings (e.g. a same file added under two names) share
+    # a single report
+    if emb1.index_to_key == emb2.index_to_key and np.array_equal(
+        emb1.vectors, emb2.vectors
+    ):
+        logger.info(f"Computing {emb1_id} neighborhoods...")
+        report_df = build_report(emb1, comparison.n_neighbors)
+
+        return report_df, report_df
+
+    logger.info(f"Computing {emb1_id} and {emb2_id} neighborhoods...")
+
+    # Embeddings are independent so both reports are computed concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        reports_dfs = executor.map(
+            build_report, comparison.embeddings, [comparison.n_neighbors] * 2
+        )
+
+    return tuple(reports_dfs)
+
+
+@st.cache_data(max_entries=8)
+def load_and_cache_labels(labels_path: str, labels_format: str) -> dict:
+    """Load and cache a label file
+
+    Args:
+        labels_path (str): labels file path
+        labels_format (str): labels file format
+
+    Returns:
+        dict: labels dict
+    """
+    # We use load_frequencies since frequencies are stored in the same formats
+    # than labels
+    return load_frequencies(labels_path, format=labels_format)
+
+
 def load_and_cache_embeddings_labels(
     config_embeddings: dict, emb1_id: str, emb2_id: str
 ) -> Tuple[dict, dict]:
-    """Load a label file
+    """Load labels of both embeddings
 
     Args:
         config_embeddings (dict): embedding configuration
@@ -174,8 +326,6 @@ def load_and_cache_embeddings_labels(
 
         labels_format = emb_infos.get("labels_format", path.suffix[1:])
 
-        # We use load_frequencies since frequencies are stored in the same formats
-        # than labels
-        labels.append(load_frequencies(path, format=labels_format))
+        labels.append(load_and_cache_labels(path.as_posix(), labels_format))
 
     return labels
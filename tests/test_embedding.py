@@ -209,6 +209,20 @@ def test_get_frequency():
     assert embedding.get_frequency(1) == pytest.approx(0.1)
 
 
+def test_get_frequencies():
+    embedding = Embedding.load_from_dict(
+        {"a": [0, 1], "b": [0, 2], "c": [0, 3]},
+        frequencies={"a": 0.3, "b": 0.2, "c": 0.1},
+    )
+
+    assert np.allclose(embedding.get_frequencies(["c", "a"]), [0.1, 0.3])
+    assert np.allclose(embedding.get_frequencies([1, "c"]), [0.2, 0.1])
+    assert embedding.get_frequencies([]).shape == (0,)
+
+    with pytest.raises(KeyError):
+        embedding.get_frequencies(["z"])
+
+
 def test_set_frequencies():
     embedding = Embedding.load_from_dict({"a": [0, 1], "b": [0, 2], "c": [0, 3]})
     frequencies = [0.1, 0.2, 0.3]
@@ -1,3 +1,5 @@
+import random
+
 import numpy as np
 import pytest
 from embcompare import Embedding, EmbeddingComparison
@@ -271,5 +273,27 @@ def test_sampled_comparison(comparison_AB: EmbeddingComparison):
     assert len(emb1.key_to_index) == 3
     assert len(emb2.key_to_index) == 3
 
+    # Random sampling is reproducible when a random state is given
+    first_sample, second_sample = [
+        comparison_AB.sampled_comparison(
+            n_samples=3, strategy="random", random_state=42
+        ).common_keys
+        for _ in range(2)
+    ]
+    assert first_sample == second_sample
+
+    # Without random state, random sampling follows the global random module state
+    global_state = random.getstate()
+    try:
+        random.seed(0)
+        first_sample = comparison_AB.sampled_comparison(n_samples=3, strategy="random")
+
+        random.seed(0)
+        second_sample = comparison_AB.sampled_comparison(n_samples=3, strategy="random")
+    finally:
+        random.setstate(global_state)
+
+    assert first_sample.common_keys == second_sample.common_keys
+
     with pytest.raises(ValueError):
         comparison_AB.sampled_comparison(strategy="noway")